@@ -2,10 +2,12 @@
 
 import yfinance as yf
 import pandas as pd
+import numpy as np
 import os
 
 # Define stock tickers grouped by sectors
-tickers = [
+# Deduplicated in listing order (e.g. CMCSA appears under two sectors)
+tickers = tuple(dict.fromkeys([
     # Technology
     "AAPL", "MSFT", "GOOGL", "AMZN", "NVDA", "META", "TSLA", "ADBE", "CRM", "INTC",
     "CSCO", "AMD", "QCOM", "TXN", "AVGO", "ORCL", "IBM", "ACN", "CMCSA", "NFLX",
@@ -29,7 +31,7 @@ tickers = [
     "LIN", "APD", "ECL", "SHW", "DD",
     # Real Estate
     "PLD", "EQIX", "AMT", "PSA"
-]
+]))
 
 # Define date range for historical data
 start_date = "2011-01-01"
@@ -39,16 +41,92 @@ end_date = "2025-05-31"
 output_directory = "Data"
 output_filename = "stocks.csv"
 output_path = os.path.join(output_directory, output_filename)
+parquet_path = os.path.join(output_directory, "stocks.parquet")
 
+# The Parquet copy is optional and only written when pyarrow is installed
 try:
+    import pyarrow  # noqa: F401
+    write_parquet = True
+except ImportError:
+    write_parquet = False
+
+# Days re-fetched before the last saved row to detect revised adjusted prices
+overlap_days = 14
+
+# yf.download keeps module-global state, so it must not be called from several
+# threads at once; a single call with threads enabled parallelises internally
+def download_prices(start, symbols=tickers):
+    data = yf.download(list(symbols), start=start, end=end_date, threads=True)["Close"]
+    if isinstance(data, pd.Series):  # Older yfinance returns a Series for one symbol
+        data = data.to_frame(symbols[0])
+    if not data.columns.is_unique:
+        raise RuntimeError("Downloaded prices contain duplicate ticker columns")
+    missing = [t for t in symbols if t not in data.columns or data[t].isna().all()]
+    if missing:
+        raise RuntimeError(f"No prices returned for: {', '.join(missing)}")
+    return data.sort_index(axis=1)
+
+# Forward fill every column in one vectorised pass over the price array
+def forward_fill(frame):
+    values = frame.to_numpy(dtype=float, copy=False)
+    rows = np.where(np.isnan(values), 0, np.arange(values.shape[0])[:, None])
+    np.maximum.accumulate(rows, axis=0, out=rows)
+    return pd.DataFrame(values[rows, np.arange(values.shape[1])], index=frame.index, columns=frame.columns)
+
+# Compact copy of the prices for loading into pandas; nothing in this repo reads it
+def save_parquet(frame):
+    # float32 is ample for prices and halves the file; the CSV is not narrowed
+    frame.astype(np.float32).to_parquet(parquet_path, engine="pyarrow", compression="snappy")
+
+# Load previously saved prices so only the missing tail has to be fetched.
+# The CSV is the full precision copy; the float32 Parquet file is never reloaded
+def load_existing():
+    if os.path.exists(output_path):
+        return pd.read_csv(output_path, index_col=0, parse_dates=True)
+    return None
+
+try:
+    existing = load_existing()
+    if existing is not None and set(existing.columns) != set(tickers):
+        existing = None  # Ticker list changed; rebuild the full history
+
+    fetch_start = start_date
+    if existing is not None:
+        last_date = existing.index.max()
+        if (last_date + pd.Timedelta(days=1)).strftime("%Y-%m-%d") >= end_date:
+            print(f"Close prices in {output_path} are already up to date.")
+            if write_parquet and not os.path.exists(parquet_path):
+                save_parquet(existing)
+                print(f"Saved Parquet copy to {parquet_path}")
+            exit()
+        fetch_start = (last_date - pd.Timedelta(days=overlap_days)).strftime("%Y-%m-%d")
+
     # Download adjusted close prices and forward fill missing values
-    data = yf.download(tickers, start=start_date, end=end_date)["Close"]
-    data.ffill(inplace=True)
+    data = download_prices(fetch_start)
+    if existing is not None:
+        # Splits and dividends rescale a ticker's whole adjusted history, so any
+        # ticker whose re-fetched overlap no longer matches is fetched in full
+        overlap = data.index.intersection(existing.index)
+        saved = existing.loc[overlap, data.columns].to_numpy(dtype=float)
+        fresh = data.loc[overlap].to_numpy(dtype=float)
+        comparable = ~np.isnan(saved) & ~np.isnan(fresh)
+        matches = np.isclose(saved, fresh, rtol=1e-5, atol=1e-6) | ~comparable
+        revised = list(data.columns[~matches.all(axis=0)]) if not overlap.empty else list(data.columns)
+
+        data = pd.concat([existing, data]).sort_index(axis=1)
+        data = data[~data.index.duplicated(keep='last')]
+        if revised:
+            print(f"Adjusted prices were revised for {', '.join(revised)}; re-fetching their full history.")
+            history = download_prices(start_date, revised)
+            data = pd.concat([data.drop(columns=revised), history], axis=1).sort_index(axis=1)
+    data = forward_fill(data)
 
     # Create directory and save data
     os.makedirs(output_directory, exist_ok=True)
-    data.to_csv(output_path)
-
+    data.to_csv(output_path, float_format="%.6f")  # Read by the C++ optimiser
     print(f"Downloaded and saved close prices to {output_path}")
+    if write_parquet:
+        save_parquet(data)
+        print(f"Saved Parquet copy to {parquet_path}")
 except Exception as e:
     print(f"Error downloading data: {e}")
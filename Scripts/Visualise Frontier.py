@@ -1,7 +1,9 @@
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
 import os
+import sys
+import csv
+import functools
 import numpy as np
 
 # Define file paths
@@ -11,6 +13,13 @@ optimised_user_target_csv = os.path.join(results_dir, "User Portfolio.csv")
 optimised_max_sharpe_csv = os.path.join(results_dir, "Best Sharpe Portfolio.csv")
 output_html = os.path.join(results_dir, "Efficient Frontier Plot.html")
 
+# Use pyarrow's multi-threaded CSV parser when it is installed
+try:
+    import pyarrow  # noqa: F401
+    csv_engine = "pyarrow"
+except ImportError:
+    csv_engine = "c"
+
 print("--- Visualizing Efficient Frontier ---")
 
 # Load Efficient Frontier CSV
@@ -19,7 +28,7 @@ if not os.path.exists(efficient_frontier_csv):
     exit()
 
 try:
-    df_frontier = pd.read_csv(efficient_frontier_csv)
+    df_frontier = pd.read_csv(efficient_frontier_csv, engine=csv_engine)
     if df_frontier.empty:
         print(f"Warning: '{efficient_frontier_csv}' is empty.")
         exit()
@@ -28,6 +37,37 @@ except Exception as e:
     print(f"Error loading Efficient Frontier CSV: {e}")
     exit()
 
+# Thin very dense frontiers; beyond screen resolution extra points add no detail
+max_plot_points = 2000
+if len(df_frontier) > max_plot_points:
+    df_frontier = df_frontier.dropna(subset=['Risk', 'Return']).sort_values('Risk', ignore_index=True)
+    best_return = np.maximum.accumulate(df_frontier['Return'].to_numpy())
+    on_envelope = np.concatenate(([True], best_return[1:] > best_return[:-1]))
+    df_frontier = df_frontier[on_envelope].reset_index(drop=True)
+    if len(df_frontier) > max_plot_points:
+        # Evenly spaced picks that always keep both ends of the frontier
+        keep = np.linspace(0, len(df_frontier) - 1, max_plot_points).round().astype(int)
+        df_frontier = df_frontier.iloc[keep].reset_index(drop=True)
+    print(f"Reduced the Efficient Frontier to {len(df_frontier)} points for plotting.")
+
+# Reuse parsed results in this process until the source file's modification time changes
+def cached_by_mtime(func):
+    @functools.lru_cache(maxsize=None)
+    def load(filepath, mtime):
+        return func(filepath)
+
+    @functools.wraps(func)
+    def wrapper(filepath):
+        return load(filepath, os.path.getmtime(filepath))
+    return wrapper
+
+@cached_by_mtime
+def read_portfolio_metrics(filepath):
+    # Three key/value rows: the csv module is far cheaper than a DataFrame here
+    with open(filepath, newline='') as f:
+        rows = list(csv.reader(f))[1:4]
+    return {key: float(value) for key, value in rows}
+
 # Load portfolio metrics from file
 def load_portfolio_details(filepath, portfolio_name):
     ret, risk, sharpe = None, None, None
@@ -36,8 +76,7 @@ def load_portfolio_details(filepath, portfolio_name):
         return ret, risk, sharpe
 
     try:
-        df = pd.read_csv(filepath, nrows=3)
-        metrics = df.set_index('Metric')['Value'].to_dict()
+        metrics = read_portfolio_metrics(filepath)
         ret = metrics.get('Expected Return')
         risk = metrics.get('Portfolio Std Dev')
         sharpe = metrics.get('Sharpe Ratio')
@@ -56,37 +95,42 @@ def load_portfolio_details(filepath, portfolio_name):
 user_target_return, user_target_risk, user_target_sharpe = load_portfolio_details(optimised_user_target_csv, "User's Target Portfolio")
 optimal_sharpe_return, optimal_sharpe_risk, optimal_sharpe_value = load_portfolio_details(optimised_max_sharpe_csv, "Max Sharpe Portfolio")
 
-# Create base line plot
-fig = px.line(
-    df_frontier, x="Risk", y="Return",
+# Create base line plot (WebGL keeps pan/zoom responsive as the frontier grows)
+fig = go.Figure()
+fig.add_trace(go.Scattergl(
+    x=df_frontier["Risk"], y=df_frontier["Return"], mode="lines+markers",
+    name="Efficient Frontier", line_shape="linear",
+    marker=dict(size=8, opacity=0.7, line=dict(width=1, color='DarkSlateGrey'))
+))
+fig.update_layout(
     title="Efficient Frontier - Genetic Algorithm Optimization",
-    labels={"Risk": "Annualized Portfolio Standard Deviation", "Return": "Annualized Expected Portfolio Return"},
-    line_shape="spline",
-    markers=True
+    xaxis_title="Annualized Portfolio Standard Deviation",
+    yaxis_title="Annualized Expected Portfolio Return"
 )
 
-# Enhance marker visibility
-fig.update_traces(marker=dict(size=8, opacity=0.7, line=dict(width=1, color='DarkSlateGrey')),
-                  selector=dict(mode='markers'))
+# Risk extremes, computed once for the target line and min risk marker
+frontier_risk = df_frontier['Risk'].to_numpy()
+min_risk_index = np.nanargmin(frontier_risk)
+min_risk, max_risk = frontier_risk[min_risk_index], np.nanmax(frontier_risk)
 
 # Add individual frontier points
-fig.add_trace(go.Scatter(
+fig.add_trace(go.Scattergl(
     x=df_frontier["Risk"], y=df_frontier["Return"], mode="markers",
     name="Frontier Portfolios", marker=dict(color="blue", size=8, opacity=0.7)
 ))
 
 # Add horizontal line and marker for user target return
 if user_target_return is not None:
-    min_risk_plot = df_frontier['Risk'].min() * 0.9
-    max_risk_plot = df_frontier['Risk'].max() * 1.1
-    fig.add_trace(go.Scatter(
+    min_risk_plot = min_risk * 0.9
+    max_risk_plot = max_risk * 1.1
+    fig.add_trace(go.Scattergl(
         x=[min_risk_plot, max_risk_plot],
         y=[user_target_return, user_target_return],
         mode="lines", name=f"User Target Return ({user_target_return:.4f})",
         line=dict(dash="dash", color="green", width=2), hoverinfo="skip"
     ))
     if user_target_risk is not None:
-        fig.add_trace(go.Scatter(
+        fig.add_trace(go.Scattergl(
             x=[user_target_risk], y=[user_target_return], mode="markers+text",
             marker=dict(color="darkgreen", size=14, symbol="circle-open",
                         line=dict(color="darkgreen", width=2)),
@@ -98,7 +142,7 @@ if user_target_return is not None:
 
 # Highlight max Sharpe portfolio
 if optimal_sharpe_risk is not None and optimal_sharpe_return is not None:
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=[optimal_sharpe_risk], y=[optimal_sharpe_return], mode="markers+text",
         marker=dict(color="red", size=12, symbol="star", line=dict(color="black", width=2)),
         name=f"Max Sharpe Portfolio (Sharpe: {optimal_sharpe_value:.3f})",
@@ -108,16 +152,15 @@ if optimal_sharpe_risk is not None and optimal_sharpe_return is not None:
     print(f"Highlighted Max Sharpe Portfolio at (Risk: {optimal_sharpe_risk:.6f}, Return: {optimal_sharpe_return:.6f}).")
 
 # Highlight min risk portfolio
-if not df_frontier.empty:
-    min_risk_row = df_frontier.loc[df_frontier['Risk'].idxmin()]
-    fig.add_trace(go.Scatter(
-        x=[min_risk_row["Risk"]], y=[min_risk_row["Return"]], mode="markers+text",
-        marker=dict(color="purple", size=12, symbol="diamond", line=dict(color="black", width=2)),
-        name="Min Risk Portfolio",
-        text=[f"Min Risk Portfolio<br>Risk: {min_risk_row['Risk']:.4f}<br>Return: {min_risk_row['Return']:.4f}"],
-        textposition="bottom center", hoverinfo="text+x+y"
-    ))
-    print(f"Highlighted Minimum Risk Portfolio at (Risk: {min_risk_row['Risk']:.6f}, Return: {min_risk_row['Return']:.6f}).")
+min_risk_row = df_frontier.iloc[min_risk_index]
+fig.add_trace(go.Scattergl(
+    x=[min_risk_row["Risk"]], y=[min_risk_row["Return"]], mode="markers+text",
+    marker=dict(color="purple", size=12, symbol="diamond", line=dict(color="black", width=2)),
+    name="Min Risk Portfolio",
+    text=[f"Min Risk Portfolio<br>Risk: {min_risk_row['Risk']:.4f}<br>Return: {min_risk_row['Return']:.4f}"],
+    textposition="bottom center", hoverinfo="text+x+y"
+))
+print(f"Highlighted Minimum Risk Portfolio at (Risk: {min_risk_row['Risk']:.6f}, Return: {min_risk_row['Return']:.6f}).")
 
 # Plot layout
 fig.update_layout(
@@ -133,9 +176,12 @@ fig.update_layout(
 
 # Save plot
 try:
-    fig.write_html(output_html, auto_open=False)
+    # Load plotly.js from the CDN rather than inlining the ~3 MB bundle
+    fig.write_html(output_html, include_plotlyjs='cdn', full_html=True, auto_open=False)
     print(f"Interactive plot saved to: '{output_html}'")
-    fig.show()
+    has_display = os.environ.get('DISPLAY') or sys.platform in ('win32', 'darwin')
+    if has_display and sys.stdout.isatty():
+        fig.show()
 except Exception as e:
     print(f"Error saving or displaying plot: {e}")
 